@@ -25,9 +25,11 @@ import argparse
 import json
 import logging
 import os
+import re
 import shlex
 import subprocess
 import sys
+import tempfile
 import time
 from pathlib import Path
 from typing import Optional, Tuple
@@ -70,6 +72,15 @@ from test_runner import (
 # 配置日志
 logger = logging.getLogger("gh-autopilot")
 
+# 兄弟 skill 所在目录（gh-autopilot/scripts/ 的上两级），导入时解析一次
+SKILLS_DIR = Path(__file__).parent.parent.parent
+
+# batch_executor 输出解析，例如:
+# ✅ Issue #42 已完成，PR #123 已合并 (耗时 2m30s)
+# ❌ Issue #42 失败 (尝试 2/4): xxx
+BATCH_SUCCESS_RE = re.compile(r"✅ Issue #(\d+) 已完成(?:，PR #(\d+) 已合并)?")
+BATCH_FAIL_RE = re.compile(r"❌ Issue #(\d+) 失败.*?: (.+)")
+
 
 class AutopilotError(Exception):
     """Autopilot 执行错误"""
@@ -589,7 +600,7 @@ class Autopilot:
 
         # 实际调用 gh-project-sync 脚本
         try:
-            script_path = Path(__file__).parent.parent.parent / "gh-project-sync" / "scripts" / "sync_project.py"
+            script_path = SKILLS_DIR / "gh-project-sync" / "scripts" / "sync_project.py"
             if script_path.exists():
                 # sync_project.py 需要 --project 参数（必选）
                 # 还需要 --issues 或 --all 或 --epic 参数之一
@@ -631,7 +642,7 @@ class Autopilot:
         # JSON 格式来自 priority_batcher.py 输出:
         # {"batches": [{"priority": "p0", "issues": [{"number": 42, "title": "xxx"}]}]}
         try:
-            script_path = Path(__file__).parent.parent.parent / "gh-project-implement" / "scripts" / "batch_executor.py"
+            script_path = SKILLS_DIR / "gh-project-implement" / "scripts" / "batch_executor.py"
             if script_path.exists():
                 # 构建 batch_executor 需要的输入 JSON
                 # 将 state 中的 issues 转换为 batches 格式
@@ -678,14 +689,9 @@ class Autopilot:
     def _parse_batch_executor_output(self, stdout: str) -> dict:
         """解析 batch_executor.py 的输出"""
         results = []
-        # batch_executor 输出格式包含:
-        # ✅ Issue #42 已完成，PR #123 已合并 (耗时 2m30s)
-        # ❌ Issue #42 失败 (尝试 2/4): xxx
-        import re
 
         # 匹配成功的 issue
-        success_pattern = r"✅ Issue #(\d+) 已完成(?:，PR #(\d+) 已合并)?"
-        for match in re.finditer(success_pattern, stdout):
+        for match in BATCH_SUCCESS_RE.finditer(stdout):
             issue_num = int(match.group(1))
             pr_num = int(match.group(2)) if match.group(2) else None
             results.append({
@@ -697,8 +703,7 @@ class Autopilot:
             })
 
         # 匹配失败的 issue
-        fail_pattern = r"❌ Issue #(\d+) 失败.*?: (.+)"
-        for match in re.finditer(fail_pattern, stdout):
+        for match in BATCH_FAIL_RE.finditer(stdout):
             issue_num = int(match.group(1))
             error_msg = match.group(2).strip()
             results.append({
@@ -719,7 +724,7 @@ class Autopilot:
         # batch_review.py 需要 --input 参数指定 JSON 文件
         # 输入格式: {"sorted": [{"issue": 108, "pr": 112, "state": "open", "priority": "p0"}]}
         try:
-            script_path = Path(__file__).parent.parent.parent / "gh-project-pr" / "scripts" / "batch_review.py"
+            script_path = SKILLS_DIR / "gh-project-pr" / "scripts" / "batch_review.py"
             if script_path.exists():
                 # 从 state 中获取 issue 结果，构建 batch_review 需要的输入
                 issue_results = self.state_manager.state.issue_results or []
@@ -751,16 +756,15 @@ class Autopilot:
                     self._log("   没有 PR 需要审查")
                     return {"merged": [], "failed": []}
 
-                # 创建临时 JSON 文件作为输入
-                import tempfile
+                # 创建临时 JSON 文件作为输入（先整体编码，再一次写入）
+                input_json = json.dumps({"sorted": sorted_items}, ensure_ascii=False)
                 with tempfile.NamedTemporaryFile(
                     mode="w",
                     suffix=".json",
                     delete=False,
                     encoding="utf-8"
                 ) as f:
-                    input_data = {"sorted": sorted_items}
-                    json.dump(input_data, f, ensure_ascii=False)
+                    f.write(input_json)
                     input_file = f.name
 
                 try:
@@ -808,7 +812,6 @@ class Autopilot:
                             self._log(f"   batch_review 错误: {result.stderr[:300]}")
                 finally:
                     # 清理临时文件
-                    import os
                     try:
                         os.unlink(input_file)
                     except OSError:
@@ -183,7 +183,8 @@ class DependencyValidator:
             return self._resolved_paths[cache_key]
 
         for path in self._get_fallback_paths(skill_name, script_name):
-            if path.exists() and path.is_file():
+            # is_file() 对不存在的路径返回 False，无需先 exists() 多一次 stat
+            if path.is_file():
                 self._resolved_paths[cache_key] = path
                 return path
 
@@ -478,17 +479,22 @@ class DependencyValidator:
 
     def print_status(self) -> None:
         """打印所有依赖的状态（用于调试）"""
-        print(f"Skills directory: {self.skills_dir}")
-        print(f"Dependencies ({len(self._dependencies)}):")
+        # 先拼装全部行再一次性输出，避免逐行 print 的多次写入
+        lines = [
+            f"Skills directory: {self.skills_dir}",
+            f"Dependencies ({len(self._dependencies)}):",
+        ]
 
         for skill_name, script_name in self._dependencies:
             info = self.validate_dependency(skill_name, script_name)
             status = "✅" if info.exists and info.is_executable else "❌"
-            print(f"  {status} {info.name}")
+            lines.append(f"  {status} {info.name}")
             if info.exists:
-                print(f"      Path: {info.path}")
+                lines.append(f"      Path: {info.path}")
             else:
-                print(f"      Error: {info.error}")
+                lines.append(f"      Error: {info.error}")
+
+        print("\n".join(lines))
 
 
 def get_validator(skills_dir: Optional[Path] = None) -> DependencyValidator:
@@ -5,7 +5,9 @@ gh-autopilot 报告生成模块。
 生成执行完成报告。
 """
 
+import json
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Optional
 from state import StateManager, AutopilotState
 
@@ -40,11 +42,16 @@ class ReportGenerator:
         else:
             return self._generate_text()
 
+    def _merged_prs(self) -> list[dict]:
+        """已合并的 PR 结果（统计与明细共用）"""
+        return [r for r in self.state.pr_results if r.get("status") == "merged"]
+
     def _generate_text(self) -> str:
         """生成文本格式报告"""
         width = 62
         lines = []
         bc = self.BOX_CHARS
+        merged_prs = self._merged_prs()
 
         # 标题
         lines.append(bc["tl"] + bc["h"] * width + bc["tr"])
@@ -63,20 +70,18 @@ class ReportGenerator:
         lines.append(bc["v"] + " 📊 执行统计".ljust(width) + bc["v"])
         lines.append(self._format_row("├─ Issue 创建", f"{self.state.total_issues} 个", width))
         lines.append(self._format_row("├─ 成功实现", f"{self.state.success_count} 个", width))
-        lines.append(self._format_row("├─ PR 合并", f"{len([r for r in self.state.pr_results if r.get('status') == 'merged'])} 个", width))
+        lines.append(self._format_row("├─ PR 合并", f"{len(merged_prs)} 个", width))
         lines.append(self._format_row("└─ 失败项", f"{self.state.failed_count} 个", width))
 
         # 成功的 PR
-        if self.config.show_details and self.state.pr_results:
-            merged_prs = [r for r in self.state.pr_results if r.get("status") == "merged"]
-            if merged_prs:
-                lines.append(bc["ml"] + bc["h"] * width + bc["mr"])
-                lines.append(bc["v"] + " ✅ 成功合并的 PR:".ljust(width) + bc["v"])
-                for pr in merged_prs[:5]:  # 最多显示 5 个
-                    pr_text = f"   - #{pr['pr_number']}"
-                    lines.append(bc["v"] + pr_text.ljust(width) + bc["v"])
-                if len(merged_prs) > 5:
-                    lines.append(bc["v"] + f"   ... 还有 {len(merged_prs) - 5} 个".ljust(width) + bc["v"])
+        if self.config.show_details and merged_prs:
+            lines.append(bc["ml"] + bc["h"] * width + bc["mr"])
+            lines.append(bc["v"] + " ✅ 成功合并的 PR:".ljust(width) + bc["v"])
+            for pr in merged_prs[:5]:  # 最多显示 5 个
+                pr_text = f"   - #{pr['pr_number']}"
+                lines.append(bc["v"] + pr_text.ljust(width) + bc["v"])
+            if len(merged_prs) > 5:
+                lines.append(bc["v"] + f"   ... 还有 {len(merged_prs) - 5} 个".ljust(width) + bc["v"])
 
         # 失败项
         if self.config.show_failures and self.state.failed_count > 0:
@@ -112,20 +117,18 @@ class ReportGenerator:
         lines.append("|------|------|")
         lines.append(f"| Issue 创建 | {self.state.total_issues} |")
         lines.append(f"| 成功实现 | {self.state.success_count} |")
-        merged_count = len([r for r in self.state.pr_results if r.get("status") == "merged"])
-        lines.append(f"| PR 合并 | {merged_count} |")
+        merged_prs = self._merged_prs()
+        lines.append(f"| PR 合并 | {len(merged_prs)} |")
         lines.append(f"| 失败项 | {self.state.failed_count} |")
         lines.append("")
 
         # 成功的 PR
-        if self.config.show_details:
-            merged_prs = [r for r in self.state.pr_results if r.get("status") == "merged"]
-            if merged_prs:
-                lines.append("## ✅ 成功合并的 PR")
-                lines.append("")
-                for pr in merged_prs:
-                    lines.append(f"- #{pr['pr_number']}")
-                lines.append("")
+        if self.config.show_details and merged_prs:
+            lines.append("## ✅ 成功合并的 PR")
+            lines.append("")
+            for pr in merged_prs:
+                lines.append(f"- #{pr['pr_number']}")
+            lines.append("")
 
         # 失败项
         if self.config.show_failures and self.state.failed_count > 0:
@@ -140,7 +143,6 @@ class ReportGenerator:
 
     def _generate_json(self) -> str:
         """生成 JSON 格式报告"""
-        import json
         return json.dumps({
             "status": self.state.current_phase,
             "input": self.state.input_source,
@@ -170,8 +172,6 @@ class ReportGenerator:
 
     def _calculate_duration(self) -> str:
         """计算执行时长"""
-        from datetime import datetime
-
         if not self.state.start_time:
             return "N/A"
 
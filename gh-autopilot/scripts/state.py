@@ -9,6 +9,8 @@ gh-autopilot 状态管理模块。
 import json
 import os
 import shutil
+import stat
+import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
@@ -16,6 +18,35 @@ from pathlib import Path
 from typing import Optional, Any
 
 
+def _atomic_write_text(path: Path, content: str) -> None:
+    """
+    原子写入文本文件：同目录临时文件 + fsync + os.replace。
+
+    写入中途崩溃时保留旧文件完整，不会留下截断的 JSON。
+    临时文件名为 ".{name}.<随机>.tmp"，以 .tmp 结尾，不会被 *.json 列举到。
+    临时文件以 0o666 创建由内核套用 umask（与普通新建文件一致）；
+    目标文件已存在时改为沿用其原有权限。
+    """
+    tmp_path = path.parent / f".{path.name}.{uuid.uuid4().hex[:12]}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            try:
+                os.fchmod(f.fileno(), stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 class Phase(str, Enum):
     """执行阶段枚举"""
     INIT = "init"
@@ -220,26 +251,26 @@ class StateManager:
 
     def init_state(self, input_source: str) -> AutopilotState:
         """初始化新的执行状态"""
+        # 同一时刻派生 run_id 与 start_time，避免两次取时跨秒导致不一致
+        now = datetime.now()
         self.state = AutopilotState(
-            run_id=datetime.now().strftime("%Y%m%d_%H%M%S"),
+            run_id=now.strftime("%Y%m%d_%H%M%S"),
             input_source=input_source,
-            start_time=datetime.now().isoformat(),
+            start_time=now.isoformat(),
             current_phase=Phase.INIT.value,
         )
-        self._save()
-        self._save_checkpoint_file()
+        self._save_all()
         return self.state
 
     def load_state(self) -> Optional[AutopilotState]:
         """加载现有状态"""
-        if not self.state_path.exists():
-            return None
-
         try:
             with open(self.state_path, "r", encoding="utf-8") as f:
                 data = json.load(f)
             self.state = self._deserialize_state(data)
             return self.state
+        except FileNotFoundError:
+            return None
         except (json.JSONDecodeError, TypeError, KeyError) as e:
             return None
 
@@ -261,20 +292,32 @@ class StateManager:
                 data[key] = default_val
         return AutopilotState(**data)
 
-    def _save(self) -> None:
+    def _serialize(self) -> str:
+        """序列化当前状态（一次性编码，供多处写入复用）"""
+        return json.dumps(asdict(self.state), ensure_ascii=False, indent=2)
+
+    def _save(self, content: Optional[str] = None) -> None:
         """保存状态到文件"""
+        if content is None:
+            content = self._serialize()
         self.state_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(self.state), f, ensure_ascii=False, indent=2)
+        _atomic_write_text(self.state_path, content)
 
-    def _save_checkpoint_file(self) -> None:
+    def _save_checkpoint_file(self, content: Optional[str] = None) -> None:
         """保存状态到 checkpoint 目录"""
         if not self.state.run_id:
             return
+        if content is None:
+            content = self._serialize()
         self.CHECKPOINT_DIR.mkdir(parents=True, exist_ok=True)
         checkpoint_path = self.CHECKPOINT_DIR / f"{self.state.run_id}.json"
-        with open(checkpoint_path, "w", encoding="utf-8") as f:
-            json.dump(asdict(self.state), f, ensure_ascii=False, indent=2)
+        _atomic_write_text(checkpoint_path, content)
+
+    def _save_all(self) -> None:
+        """同时保存状态文件与 checkpoint 文件，状态只序列化一次"""
+        content = self._serialize()
+        self._save(content)
+        self._save_checkpoint_file(content)
 
     def checkpoint(
         self,
@@ -318,8 +361,7 @@ class StateManager:
             if step_key not in self.state.completed_steps:
                 self.state.completed_steps.append(step_key)
 
-        self._save()
-        self._save_checkpoint_file()
+        self._save_all()
 
         return checkpoint
 
@@ -384,8 +426,7 @@ class StateManager:
         self.state.last_error = str(error)
         self.state.retry_count += 1
 
-        self._save()
-        self._save_checkpoint_file()
+        self._save_all()
 
         return error_record
 
@@ -403,13 +444,11 @@ class StateManager:
         if run_id:
             # 从 checkpoint 目录加载指定的 run
             checkpoint_path = self.CHECKPOINT_DIR / f"{run_id}.json"
-            if not checkpoint_path.exists():
-                return None
             try:
                 with open(checkpoint_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
                 self.state = self._deserialize_state(data)
-            except (json.JSONDecodeError, TypeError, KeyError):
+            except (FileNotFoundError, json.JSONDecodeError, TypeError, KeyError):
                 return None
         else:
             # 尝试从当前状态文件恢复
@@ -437,8 +476,7 @@ class StateManager:
         # 生成新的 run_id 以区分本次运行
         self.state.run_id = f"{original_run_id}_r{self.state.resume_count}"
 
-        self._save()
-        self._save_checkpoint_file()
+        self._save_all()
 
         return resume_info
 
@@ -463,10 +501,17 @@ class StateManager:
             可恢复运行的列表
         """
         runs = []
-        if not self.CHECKPOINT_DIR.exists():
+        # 单次 scandir 完成目录存在性检查与列举（与 glob("*.json") 一致，仅列普通文件）
+        try:
+            with os.scandir(self.CHECKPOINT_DIR) as it:
+                checkpoint_files = [
+                    entry.path for entry in it
+                    if entry.name.endswith(".json") and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
             return runs
 
-        for checkpoint_file in self.CHECKPOINT_DIR.glob("*.json"):
+        for checkpoint_file in checkpoint_files:
             try:
                 with open(checkpoint_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
@@ -583,8 +628,7 @@ class StateManager:
 
     def clear(self) -> None:
         """清除状态文件"""
-        if self.state_path.exists():
-            self.state_path.unlink()
+        self.state_path.unlink(missing_ok=True)
         self.state = AutopilotState()
 
 
@@ -20,7 +20,20 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Union
+
+
+def _decode_output(data: Optional[Union[bytes, str]]) -> str:
+    """
+    将子进程输出解码为文本；非 UTF-8 字节用替换字符保留，不因解码失败丢结果。
+
+    与 text=True 的通用换行模式一致，CRLF 与单独的 CR 统一转换为 LF。
+    """
+    if not data:
+        return ""
+    if not isinstance(data, str):
+        data = data.decode("utf-8", errors="replace")
+    return data.replace("\r\n", "\n").replace("\r", "\n")
 
 
 class TestStatus(str, Enum):
@@ -174,6 +187,9 @@ class TestRunner:
         r"gradle\s+test",
     ]
 
+    # 测试命令关键字（子串匹配；"pytest"/"npm test"/"go test" 等均已被 "test" 覆盖）
+    TEST_KEYWORDS = ("test", "spec", "check", "lint")
+
     # Test Plan 标记正则
     TEST_PLAN_PATTERNS = [
         r"##\s*Test\s*Plan",
@@ -182,6 +198,15 @@ class TestRunner:
         r"##\s*Test\s*Command",
         r"\*\*Test\s*Command\*\*",
     ]
+    TEST_PLAN_RES = tuple(re.compile(p, re.IGNORECASE) for p in TEST_PLAN_PATTERNS)
+
+    # 解析/检测用正则（类加载时编译一次）
+    CHECKBOX_RE = re.compile(r"-\s*\[[ xX]?\]\s*`?([^`\n]+)`?")
+    TEST_COMMAND_FIELD_RE = re.compile(r"\*\*Test\s*Command\*\*:\s*`([^`]+)`", re.IGNORECASE)
+    CODE_BLOCK_RE = re.compile(r"```(?:bash|sh|shell)?\n([\s\S]*?)```")
+    NEXT_SECTION_RE = re.compile(r"\n##\s")
+    MAKE_TEST_TARGET_RE = re.compile(r"^test\s*:", re.MULTILINE)
+    MAKE_LINT_TARGET_RE = re.compile(r"^lint\s*:", re.MULTILINE)
 
     def __init__(
         self,
@@ -233,8 +258,7 @@ class TestRunner:
         seen_commands = set()  # 去重
 
         # 1. 解析 checkbox 格式: - [ ] command 或 - [x] command
-        checkbox_pattern = r"-\s*\[[ xX]?\]\s*`?([^`\n]+)`?"
-        for match in re.finditer(checkbox_pattern, source):
+        for match in self.CHECKBOX_RE.finditer(source):
             command = match.group(1).strip()
             if self._is_test_command(command) and command not in seen_commands:
                 steps.append(TestStep(
@@ -244,8 +268,7 @@ class TestRunner:
                 seen_commands.add(command)
 
         # 2. 解析 Test Command 字段格式
-        test_cmd_pattern = r"\*\*Test\s*Command\*\*:\s*`([^`]+)`"
-        for match in re.finditer(test_cmd_pattern, source, re.IGNORECASE):
+        for match in self.TEST_COMMAND_FIELD_RE.finditer(source):
             command = match.group(1).strip()
             if command not in seen_commands:
                 steps.append(TestStep(
@@ -258,8 +281,7 @@ class TestRunner:
         test_plan_section = self._extract_test_plan_section(source)
         if test_plan_section:
             # 解析代码块
-            code_block_pattern = r"```(?:bash|sh|shell)?\n([\s\S]*?)```"
-            for match in re.finditer(code_block_pattern, test_plan_section):
+            for match in self.CODE_BLOCK_RE.finditer(test_plan_section):
                 for line in match.group(1).strip().split("\n"):
                     command = line.strip()
                     if command and not command.startswith("#") and command not in seen_commands:
@@ -278,40 +300,36 @@ class TestRunner:
 
     def _extract_test_plan_section(self, source: str) -> str:
         """提取 Test Plan 部分内容"""
-        for pattern in self.TEST_PLAN_PATTERNS:
-            match = re.search(pattern, source, re.IGNORECASE)
+        for pattern in self.TEST_PLAN_RES:
+            match = pattern.search(source)
             if match:
                 start = match.end()
-                # 找到下一个 ## 标题或文档结尾
-                next_section = re.search(r"\n##\s", source[start:])
+                # 找到下一个 ## 标题或文档结尾（从 start 处直接搜索，避免复制剩余文本）
+                next_section = self.NEXT_SECTION_RE.search(source, start)
                 if next_section:
-                    return source[start:start + next_section.start()]
+                    return source[start:next_section.start()]
                 return source[start:]
         return ""
 
     def _is_test_command(self, command: str) -> bool:
         """判断是否为测试命令"""
         command_lower = command.lower()
-        test_keywords = [
-            "pytest", "test", "spec", "check", "lint",
-            "npm test", "yarn test", "make test", "cargo test",
-            "go test", "mvn test", "gradle test",
-        ]
-        return any(keyword in command_lower for keyword in test_keywords)
+        return any(keyword in command_lower for keyword in self.TEST_KEYWORDS)
 
     def _extract_description(self, command: str) -> str:
         """从命令提取描述"""
-        if "pytest" in command.lower():
+        command_lower = command.lower()
+        if "pytest" in command_lower:
             return "Run pytest tests"
-        elif "npm" in command.lower():
+        elif "npm" in command_lower:
             return "Run npm tests"
-        elif "make" in command.lower():
-            if "lint" in command.lower():
+        elif "make" in command_lower:
+            if "lint" in command_lower:
                 return "Run linting"
             return "Run make tests"
-        elif "cargo" in command.lower():
+        elif "cargo" in command_lower:
             return "Run Rust tests"
-        elif "go test" in command.lower():
+        elif "go test" in command_lower:
             return "Run Go tests"
         return f"Run: {command[:50]}"
 
@@ -336,39 +354,40 @@ class TestRunner:
                     ))
                 break
 
-        # 检测 npm
+        # 检测 npm（直接打开，文件不存在时 FileNotFoundError 由 IOError 分支吞掉）
         package_json = self.working_dir / "package.json"
-        if package_json.exists():
-            try:
-                with open(package_json, "r", encoding="utf-8") as f:
-                    pkg = json.load(f)
-                if "scripts" in pkg and "test" in pkg["scripts"]:
-                    steps.append(TestStep(
-                        command="npm test",
-                        description="Auto-detected npm test",
-                    ))
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            with open(package_json, "r", encoding="utf-8") as f:
+                pkg = json.load(f)
+            if "scripts" in pkg and "test" in pkg["scripts"]:
+                steps.append(TestStep(
+                    command="npm test",
+                    description="Auto-detected npm test",
+                ))
+        except (json.JSONDecodeError, IOError):
+            pass
 
         # 检测 Makefile
         for marker in self.FRAMEWORK_DETECTORS["make"]:
             makefile = self.working_dir / marker
-            if makefile.exists():
-                try:
-                    content = makefile.read_text(encoding="utf-8")
-                    if re.search(r"^test\s*:", content, re.MULTILINE):
-                        steps.append(TestStep(
-                            command="make test",
-                            description="Auto-detected make test",
-                        ))
-                    if re.search(r"^lint\s*:", content, re.MULTILINE):
-                        steps.append(TestStep(
-                            command="make lint",
-                            description="Auto-detected make lint",
-                        ))
-                except IOError:
-                    pass
+            try:
+                content = makefile.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            except IOError:
+                # 文件存在但读取失败：与找到 Makefile 同样停止检测
                 break
+            if self.MAKE_TEST_TARGET_RE.search(content):
+                steps.append(TestStep(
+                    command="make test",
+                    description="Auto-detected make test",
+                ))
+            if self.MAKE_LINT_TARGET_RE.search(content):
+                steps.append(TestStep(
+                    command="make lint",
+                    description="Auto-detected make lint",
+                ))
+            break
 
         return steps
 
@@ -389,7 +408,7 @@ class TestRunner:
         """
         results = TestResults(start_time=datetime.now().isoformat())
 
-        for step in steps:
+        for idx, step in enumerate(steps):
             # 回调: 步骤开始
             if self.on_step_start:
                 self.on_step_start(step)
@@ -416,14 +435,14 @@ class TestRunner:
 
             # 失败时停止
             if stop_on_failure and step_result.status in (TestStatus.FAILED, TestStatus.ERROR):
-                # 标记剩余步骤为 skipped
-                remaining_idx = steps.index(step) + 1
-                for remaining_step in steps[remaining_idx:]:
+                # 标记剩余步骤为 skipped（同一时刻跳过，共用一个时间戳）
+                skipped_at = datetime.now().isoformat()
+                for remaining_step in steps[idx + 1:]:
                     skipped_result = TestStepResult(
                         step=remaining_step,
                         status=TestStatus.SKIPPED,
                         error_message="Skipped due to previous failure",
-                        timestamp=datetime.now().isoformat(),
+                        timestamp=skipped_at,
                     )
                     results.details.append(skipped_result)
                     results.skipped += 1
@@ -440,10 +459,6 @@ class TestRunner:
         # 确定工作目录
         cwd = Path(step.working_dir) if step.working_dir else self.working_dir
 
-        # 准备环境变量
-        env = os.environ.copy()
-        env.update(step.env)
-
         try:
             # 检查命令是否可执行
             cmd_parts = step.command.split()
@@ -465,6 +480,10 @@ class TestRunner:
                     timestamp=timestamp,
                 )
 
+            # 准备环境变量（通过上述快速失败检查后才复制 os.environ）
+            env = os.environ.copy()
+            env.update(step.env)
+
             # 执行命令
             result = subprocess.run(
                 step.command,
@@ -472,7 +491,6 @@ class TestRunner:
                 cwd=str(cwd),
                 env=env,
                 capture_output=True,
-                text=True,
                 timeout=step.timeout,
             )
 
@@ -488,8 +506,8 @@ class TestRunner:
                 step=step,
                 status=status,
                 return_code=result.returncode,
-                stdout=result.stdout,
-                stderr=result.stderr,
+                stdout=_decode_output(result.stdout),
+                stderr=_decode_output(result.stderr),
                 duration=duration,
                 timestamp=timestamp,
             )
@@ -501,8 +519,8 @@ class TestRunner:
                 status=TestStatus.ERROR,
                 error_message=f"Timeout after {step.timeout}s",
                 duration=duration,
-                stdout=e.stdout.decode() if e.stdout else "",
-                stderr=e.stderr.decode() if e.stderr else "",
+                stdout=_decode_output(e.stdout),
+                stderr=_decode_output(e.stderr),
                 timestamp=timestamp,
             )
 
@@ -617,10 +635,11 @@ def parse_dev_plan_tests(dev_plan_path: str) -> List[TestStep]:
         TestStep 列表
     """
     path = Path(dev_plan_path)
-    if not path.exists():
+    try:
+        content = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return []
 
-    content = path.read_text(encoding="utf-8")
     runner = TestRunner(working_dir=str(path.parent))
     return runner.parse_test_plan(content)
 
@@ -0,0 +1,23 @@
+"""
+gh-autopilot 测试公共配置。
+
+默认状态文件 (.claude/autopilot-state.json，相对 cwd) 与 checkpoint 目录
+(~/.cache/gh-autopilot/state) 统一重定向到每个测试的 tmp_path，避免测试污染工作区与用户目录。
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from state import StateManager  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def isolated_state_paths(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        StateManager, "DEFAULT_STATE_PATH", str(tmp_path / ".claude" / "autopilot-state.json")
+    )
+    monkeypatch.setattr(StateManager, "CHECKPOINT_DIR", tmp_path / "checkpoints")
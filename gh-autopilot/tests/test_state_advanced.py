@@ -6,6 +6,8 @@ state.py 进阶分支覆盖测试（checkpoint/resume 等）。
 from __future__ import annotations
 
 import json
+import os
+import stat
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -89,6 +91,12 @@ def test_checkpoint_and_get_checkpoint(tmp_path, monkeypatch):
     assert got is not None
     assert got.step == "prd_read"
 
+    # 状态文件与 checkpoint 文件内容一致
+    state_text = (tmp_path / "state.json").read_text(encoding="utf-8")
+    checkpoint_text = (checkpoint_dir / f"{manager.state.run_id}.json").read_text(encoding="utf-8")
+    assert state_text == checkpoint_text
+    assert json.loads(state_text)["last_successful_step"] == "prd_read"
+
 
 def test_record_error_and_resume_from_checkpoint(tmp_path, monkeypatch):
     checkpoint_dir = tmp_path / "checkpoints"
@@ -156,6 +164,47 @@ def test_get_resumable_runs_filters_and_sorts(tmp_path, monkeypatch):
     assert runs[0]["run_id"] == "r1"
 
 
+def test_get_resumable_runs_missing_dir_and_non_json(tmp_path, monkeypatch):
+    checkpoint_dir = tmp_path / "checkpoints"
+    monkeypatch.setattr(StateManager, "CHECKPOINT_DIR", checkpoint_dir)
+    manager = StateManager(str(tmp_path / "state.json"))
+    assert manager.get_resumable_runs() == []
+
+    checkpoint_dir.mkdir()
+    run = {"run_id": "r1", "current_phase": Phase.PRD.value}
+    (checkpoint_dir / "notes.txt").write_text(json.dumps(run), encoding="utf-8")
+    (checkpoint_dir / ".r1.json.abc123.tmp").write_text(json.dumps(run), encoding="utf-8")
+    (checkpoint_dir / "sub.json").mkdir()
+    assert manager.get_resumable_runs() == []
+
+    # 与 glob("*.json") 一致，以 "." 开头的 .json 文件同样列出
+    (checkpoint_dir / ".hidden.json").write_text(json.dumps(run), encoding="utf-8")
+    assert [r["run_id"] for r in manager.get_resumable_runs()] == ["r1"]
+
+
+def test_save_is_atomic_on_write_failure(tmp_path, monkeypatch):
+    checkpoint_dir = tmp_path / "checkpoints"
+    monkeypatch.setattr(StateManager, "CHECKPOINT_DIR", checkpoint_dir)
+
+    state_path = tmp_path / "state.json"
+    manager = StateManager(str(state_path))
+    manager.init_state("input")
+    before = state_path.read_text(encoding="utf-8")
+
+    def boom(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("state.os.replace", boom)
+    manager.state.prd_title = "changed"
+    with pytest.raises(OSError):
+        manager._save()
+
+    # 原文件保持完整，临时文件被清理
+    assert state_path.read_text(encoding="utf-8") == before
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["checkpoints", "state.json"]
+    assert len(manager.get_resumable_runs()) == 1
+
+
 def test_calculate_duration_branches(tmp_path):
     manager = StateManager(str(tmp_path / "state.json"))
     manager.state.start_time = ""
@@ -167,3 +216,22 @@ def test_calculate_duration_branches(tmp_path):
     # minutes 分支
     assert "m" in manager._calculate_duration()
 
+
+def test_save_keeps_umask_default_and_existing_mode(tmp_path, monkeypatch):
+    checkpoint_dir = tmp_path / "checkpoints"
+    monkeypatch.setattr(StateManager, "CHECKPOINT_DIR", checkpoint_dir)
+
+    state_path = tmp_path / "state.json"
+    old_umask = os.umask(0o022)
+    try:
+        manager = StateManager(str(state_path))
+        manager.init_state("input")
+        assert stat.S_IMODE(state_path.stat().st_mode) == 0o644
+
+        # 已存在的文件沿用其原有权限
+        state_path.chmod(0o640)
+        manager.state.prd_title = "changed"
+        manager._save()
+        assert stat.S_IMODE(state_path.stat().st_mode) == 0o640
+    finally:
+        os.umask(old_umask)
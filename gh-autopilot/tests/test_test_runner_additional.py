@@ -6,6 +6,7 @@ test_runner.py 补充分支覆盖测试。
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -77,6 +78,51 @@ def test_auto_detect_makefile_read_error_is_ignored(tmp_path):
     assert steps == []
 
 
+def test_execute_single_step_decodes_non_utf8_output(tmp_path):
+    runner = TestRunner(working_dir=str(tmp_path))
+    step = TestStep(command="pytest -v", timeout=5)
+
+    completed = subprocess.CompletedProcess(
+        args="pytest -v", returncode=1, stdout=b"ok \xff\r\nnext\rlast\n", stderr=b"\xfe err"
+    )
+    with patch("shutil.which", return_value="/usr/bin/pytest"), \
+            patch("subprocess.run", return_value=completed):
+        result = runner._execute_single_step(step)
+    assert result.status == TestStatus.FAILED
+    assert result.stdout == "ok \ufffd\nnext\nlast\n"
+    assert result.stderr == "\ufffd err"
+
+    timeout = subprocess.TimeoutExpired(cmd="pytest -v", timeout=5, output=b"partial \xff")
+    with patch("shutil.which", return_value="/usr/bin/pytest"), \
+            patch("subprocess.run", side_effect=timeout):
+        result = runner._execute_single_step(step)
+    assert result.status == TestStatus.ERROR
+    assert result.stdout == "partial \ufffd"
+    assert result.stderr == ""
+
+
+def test_stop_on_failure_with_duplicate_step_skips_only_remaining(tmp_path):
+    runner = TestRunner(working_dir=str(tmp_path))
+    # 第三步与第一步相等：应按实际位置跳过其后的步骤
+    steps = [
+        TestStep(command="pytest a"),
+        TestStep(command="pytest b"),
+        TestStep(command="pytest a"),
+        TestStep(command="pytest c"),
+    ]
+    outcomes = [
+        subprocess.CompletedProcess(args="", returncode=0, stdout=b"", stderr=b""),
+        subprocess.CompletedProcess(args="", returncode=0, stdout=b"", stderr=b""),
+        subprocess.CompletedProcess(args="", returncode=1, stdout=b"", stderr=b""),
+    ]
+    with patch("shutil.which", return_value="/usr/bin/pytest"), \
+            patch("subprocess.run", side_effect=outcomes):
+        results = runner.execute_tests(steps, stop_on_failure=True)
+
+    assert [d.step.command for d in results.details] == ["pytest a", "pytest b", "pytest a", "pytest c"]
+    assert (results.passed, results.failed, results.skipped) == (2, 1, 1)
+
+
 def test_execute_single_step_generic_exception(tmp_path):
     runner = TestRunner(working_dir=str(tmp_path))
     step = TestStep(command="pytest -v")
@@ -765,16 +765,14 @@ def _print_report(results: list[IssueResult], interrupted: bool) -> None:
         w_status = max(len(status_col), *(len(r[3]) for r in table_rows))
         w_time = max(len(time_col), *(len(r[4]) for r in table_rows))
 
-        def _row(cols: tuple[str, str, str, str, str]) -> str:
-            c1, c2, c3, c4, c5 = cols
-            return (
-                f"{c1:<{w_issue}}  {c2:<{w_title}}  {c3:<{w_pr}}  {c4:<{w_status}}  {c5:>{w_time}}"
-            )
-
-        print(_row((issue_col, title_col, pr_col, status_col, time_col)))
-        print(_row(("-" * w_issue, "-" * w_title, "-" * w_pr, "-" * w_status, "-" * w_time)))
-        for row in table_rows:
-            print(_row(row))
+        # 列宽确定后一次性生成格式串，逐行只做 str.format，最后整表一次输出
+        row_fmt = f"{{:<{w_issue}}}  {{:<{w_title}}}  {{:<{w_pr}}}  {{:<{w_status}}}  {{:>{w_time}}}"
+        lines = [
+            row_fmt.format(issue_col, title_col, pr_col, status_col, time_col),
+            row_fmt.format("-" * w_issue, "-" * w_title, "-" * w_pr, "-" * w_status, "-" * w_time),
+        ]
+        lines.extend(row_fmt.format(*row) for row in table_rows)
+        print("\n".join(lines))
 
         print(f"\n- 总耗时: {_format_duration(total_elapsed_sec)}")
     print(f"- 总计: {total}")
@@ -3,7 +3,7 @@
 从指定 GitHub Project 获取所有 Open 状态的 Issues，并过滤掉已有 open PR 的条目。
 
 用法:
-    python3 get_project_issues.py --project 1 [--user] [--owner OWNER] [--json]
+    python3 get_project_issues.py --project 1 [--user] [--owner OWNER] [--json] [--max-workers N]
 
 示例:
     # 默认使用当前仓库 owner 的 Project
@@ -34,8 +34,11 @@ import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+PRIORITY_LABEL_PATTERN = re.compile(r"^priority:p([0-3])$")
+
 
 def get_repo_owner() -> Optional[str]:
     """从 git remote 获取仓库 owner。"""
@@ -158,7 +161,7 @@ def extract_priority(labels: list[str]) -> Optional[str]:
     """从 labels 中提取 priority（p0/p1/p2/p3），无则返回 None。"""
     best_rank: Optional[int] = None
     for label in labels:
-        m = re.match(r"^priority:p([0-3])$", label)
+        m = PRIORITY_LABEL_PATTERN.match(label)
         if not m:
             continue
         rank = int(m.group(1))
@@ -224,6 +227,12 @@ def main():
     parser.add_argument("--user", action="store_true", help="使用用户级 Project（默认为仓库级，但查询逻辑相同）")
     parser.add_argument("--owner", help="用户/组织 owner（默认从当前仓库推断）")
     parser.add_argument("--json", action="store_true", help="JSON 格式输出")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="并发查询 Issue 状态的线程数（默认 1，即串行；过高易触发 GitHub 限流）",
+    )
     args = parser.parse_args()
 
     # 确定 owner：gh project 命令只接受用户名/组织名
@@ -236,8 +245,7 @@ def main():
     items = list_project_items(owner, args.project)
 
     seen: set[tuple[str, int]] = set()
-    candidates: list[dict] = []
-    repos: set[str] = set()
+    entries: list[dict] = []
 
     for item in items:
         content = (item or {}).get("content") or {}
@@ -256,16 +264,12 @@ def main():
             continue
         seen.add(key)
 
-        state = get_issue_state(issue_repo, issue_number)
-        if not state or state.upper() != "OPEN":
-            continue
-
         labels = (item or {}).get("labels") or []
         if not isinstance(labels, list):
             labels = []
         labels = [str(l) for l in labels]
 
-        candidates.append(
+        entries.append(
             {
                 "number": issue_number,
                 "title": issue_title,
@@ -274,7 +278,19 @@ def main():
                 "_repo": issue_repo,
             }
         )
-        repos.add(issue_repo)
+
+    # 每个 Issue 一次 gh 调用，彼此独立，可按 --max-workers 并发查询（map 保持原有顺序）
+    def lookup_state(entry: dict) -> Optional[str]:
+        return get_issue_state(entry["_repo"], entry["number"])
+
+    if args.max_workers <= 1 or len(entries) <= 1:
+        states = [lookup_state(e) for e in entries]
+    else:
+        with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
+            states = list(executor.map(lookup_state, entries))
+
+    candidates = [e for e, state in zip(entries, states) if state and state.upper() == "OPEN"]
+    repos: set[str] = {e["_repo"] for e in candidates}
 
     closing_by_repo: dict[str, set[int]] = {r: get_open_pr_closing_issues(r) for r in sorted(repos)}
 
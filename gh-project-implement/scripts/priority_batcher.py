@@ -116,7 +116,10 @@ def _run_gh_issue_body(issue_number: int, repo: Optional[str], warnings: list[st
 
 def _extract_dependencies(body: str, issue_number: int) -> set[int]:
     deps: set[int] = set()
-    for m in DEP_RE.finditer(body or ""):
+    # 依赖引用必含 "#"；绝大多数 body 无引用，先做子串检查跳过正则扫描
+    if not body or "#" not in body:
+        return deps
+    for m in DEP_RE.finditer(body):
         try:
             dep = int(m.group(1))
         except ValueError:
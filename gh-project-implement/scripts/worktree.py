@@ -16,6 +16,7 @@ import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import Optional
 
 
 def get_repo_root() -> Path:
@@ -148,6 +149,20 @@ def list_worktrees():
         print(f"  #{issue_num}: {wt['path']}")
 
 
+def _get_merged_branches() -> set[str]:
+    """获取已合并到 origin/main 的本地分支名集合"""
+    merge_check = subprocess.run(
+        ["git", "branch", "--merged", "origin/main"],
+        capture_output=True, text=True
+    )
+    # 行首可能带 "* "（当前分支）或 "+ "（其他 worktree 检出的分支）
+    return {
+        line[2:].strip()
+        for line in merge_check.stdout.splitlines()
+        if line.strip()
+    }
+
+
 def cleanup_worktrees():
     """清理已合并的 worktrees"""
     result = subprocess.run(
@@ -156,17 +171,16 @@ def cleanup_worktrees():
     )
 
     cleaned = 0
+    merged_branches: Optional[set[str]] = None
     for line in result.stdout.strip().split("\n"):
         if line.startswith("worktree "):
             path = line[9:]
             if "issue-" in path:
-                # 检查分支是否已合并
+                # 已合并分支列表只查询一次（首次遇到 issue worktree 时）
+                if merged_branches is None:
+                    merged_branches = _get_merged_branches()
                 branch = Path(path).name
-                merge_check = subprocess.run(
-                    ["git", "branch", "--merged", "origin/main"],
-                    capture_output=True, text=True
-                )
-                if branch in merge_check.stdout:
+                if branch in merged_branches:
                     subprocess.run(["git", "worktree", "remove", path])
                     subprocess.run(["git", "branch", "-d", branch])
                     print(f"Cleaned up: {path}")
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+import scripts.get_project_issues as gpi
+
+
+def _item(repo: str, number: int, labels: list[str] | None = None) -> dict:
+    return {
+        "content": {"type": "Issue", "number": number, "title": f"t{number}", "repository": repo},
+        "labels": labels or [],
+    }
+
+
+ITEMS = [
+    _item("o/a", 5, ["priority:p1"]),
+    _item("o/b", 1),
+    {"content": {"type": "PullRequest", "number": 9, "repository": "o/a"}},
+    _item("o/c", 4),
+    _item("o/a", 5),  # 重复条目
+    _item("o/a", 2),
+    _item("o/d", 3),
+]
+
+STATES = {("o/a", 5): "OPEN", ("o/b", 1): None, ("o/c", 4): "CLOSED", ("o/a", 2): "open", ("o/d", 3): "OPEN"}
+
+
+def _run_main(max_workers: int, capsys: pytest.CaptureFixture[str]) -> tuple[dict, list[str], list[tuple[str, int]]]:
+    closing_repos: list[str] = []
+    lookups: list[tuple[str, int]] = []
+
+    def fake_state(repo: str, number: int):
+        lookups.append((repo, number))
+        return STATES[(repo, number)]
+
+    def fake_closing(repo: str) -> set[int]:
+        closing_repos.append(repo)
+        return {3} if repo == "o/d" else set()
+
+    argv = ["get_project_issues.py", "--project", "1", "--owner", "o", "--json", "--max-workers", str(max_workers)]
+    with patch("sys.argv", argv), \
+            patch.object(gpi, "get_project_info", return_value={"number": 1, "title": "P"}), \
+            patch.object(gpi, "list_project_items", return_value=ITEMS), \
+            patch.object(gpi, "get_issue_state", side_effect=fake_state), \
+            patch.object(gpi, "get_open_pr_closing_issues", side_effect=fake_closing):
+        gpi.main()
+
+    return json.loads(capsys.readouterr().out), closing_repos, lookups
+
+
+def test_main_keeps_project_order_and_filters_by_state(capsys: pytest.CaptureFixture[str]) -> None:
+    output, closing_repos, lookups = _run_main(1, capsys)
+
+    # 去重后每个 Issue 只查询一次状态
+    assert sorted(lookups) == sorted(STATES)
+    # None / CLOSED 被丢弃；#3 已有关闭它的 open PR
+    assert [i["number"] for i in output["issues"]] == [5, 2]
+    assert output["issues"][0]["priority"] == "p1"
+    assert all("_repo" not in i for i in output["issues"])
+    # 只查询 OPEN Issue 所在仓库的 PR
+    assert closing_repos == ["o/a", "o/d"]
+
+
+def test_main_pooled_matches_serial(capsys: pytest.CaptureFixture[str]) -> None:
+    serial = _run_main(1, capsys)
+    pooled = _run_main(4, capsys)
+
+    assert pooled[0] == serial[0]
+    assert pooled[1] == serial[1]
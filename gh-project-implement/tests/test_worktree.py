@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import subprocess
+from unittest.mock import patch
+
+import scripts.worktree as wt
+
+
+def _cp(cmd: list[str], returncode: int = 0, stdout: str = "", stderr: str = "") -> subprocess.CompletedProcess[str]:
+    return subprocess.CompletedProcess(cmd, returncode, stdout, stderr)
+
+
+def test_get_merged_branches_strips_current_and_worktree_markers() -> None:
+    stdout = "* main\n+ issue-12\n  issue-3\n\n"
+    with patch.object(wt.subprocess, "run", return_value=_cp([], stdout=stdout)):
+        assert wt._get_merged_branches() == {"main", "issue-12", "issue-3"}
+
+
+def test_cleanup_worktrees_matches_exact_branch_and_queries_merged_once(capsys) -> None:
+    porcelain = "\n".join(
+        [
+            "worktree /repo",
+            "branch refs/heads/main",
+            "",
+            "worktree /wt/issue-1",
+            "branch refs/heads/issue-1",
+            "",
+            "worktree /wt/issue-12",
+            "branch refs/heads/issue-12",
+            "",
+            "worktree /wt/issue-3",
+            "branch refs/heads/issue-3",
+        ]
+    )
+    calls: list[list[str]] = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        if cmd[:3] == ["git", "worktree", "list"]:
+            return _cp(cmd, stdout=porcelain)
+        if cmd[:3] == ["git", "branch", "--merged"]:
+            # issue-1 未合并：旧的子串匹配会因 issue-12 误判为已合并
+            return _cp(cmd, stdout="* main\n+ issue-12\n  issue-3\n")
+        return _cp(cmd)
+
+    with patch.object(wt.subprocess, "run", side_effect=fake_run):
+        wt.cleanup_worktrees()
+
+    assert sum(1 for c in calls if c[:3] == ["git", "branch", "--merged"]) == 1
+    removed = [c[3] for c in calls if c[:3] == ["git", "worktree", "remove"]]
+    deleted = [c[3] for c in calls if c[:3] == ["git", "branch", "-d"]]
+    assert removed == ["/wt/issue-12", "/wt/issue-3"]
+    assert deleted == ["issue-12", "issue-3"]
+    assert "Cleaned 2 worktrees" in capsys.readouterr().out
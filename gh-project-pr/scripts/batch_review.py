@@ -42,6 +42,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# skill 根目录（codex review 的 workdir），导入时解析一次，避免每个 PR 重复 resolve
+SKILL_DIR = Path(__file__).resolve().parents[1]
+
 
 @dataclass
 class ReviewResult:
@@ -389,7 +392,7 @@ def review_single_pr(
             pr,
             backend=review_backend,
             max_retries=max_retries,
-            workdir=str(Path(__file__).resolve().parents[1]),
+            workdir=str(SKILL_DIR),
         )
     except Exception as e:
         return ReviewResult(
@@ -219,6 +219,7 @@ def _extract_json_object(text: str) -> Optional[dict[str, Any]]:
     except json.JSONDecodeError:
         pass
 
+    # 从每个 "{" 处原地解码（raw_decode 的 idx 参数），避免每次尝试都复制剩余文本
     decoder = json.JSONDecoder()
     scan_index = 0
     while True:
@@ -226,7 +227,7 @@ def _extract_json_object(text: str) -> Optional[dict[str, Any]]:
         if start < 0:
             return None
         try:
-            parsed, _end = decoder.raw_decode(trimmed[start:])
+            parsed, _end = decoder.raw_decode(trimmed, start)
         except json.JSONDecodeError:
             scan_index = start + 1
             continue
@@ -3,7 +3,7 @@
 从 GitHub Project 获取 Issues 并查找关联的 PR。
 
 用法:
-    python3 get_project_prs.py --project 1 [--user] [--owner OWNER] [--json]
+    python3 get_project_prs.py --project 1 [--user] [--owner OWNER] [--json] [--max-workers N]
 
 功能:
     Phase 1: 获取 Project Items，过滤 Issue 类型且非 Done 状态
@@ -32,7 +32,11 @@ import json
 import re
 import subprocess
 import sys
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+PRIORITY_LABEL_PATTERN = re.compile(r"^priority:p([0-3])$")
 
 
 def get_repo_owner() -> Optional[str]:
@@ -119,7 +123,7 @@ def extract_priority(labels: list[str]) -> Optional[str]:
     """从 labels 中提取 priority（p0/p1/p2/p3），无则返回 None。"""
     best_rank: Optional[int] = None
     for label in labels:
-        m = re.match(r"^priority:p([0-3])$", label)
+        m = PRIORITY_LABEL_PATTERN.match(label)
         if not m:
             continue
         rank = int(m.group(1))
@@ -239,6 +243,37 @@ def find_pr_for_issue(repo: str, issue_number: int) -> Optional[dict]:
     return None
 
 
+def find_prs_for_issues(
+    issues: list[dict],
+    max_workers: int = 1,
+    on_result: Optional[Callable[[int, dict, Optional[dict]], None]] = None,
+) -> list[Optional[dict]]:
+    """
+    批量查找 Issues 关联的 PR，返回与 issues 顺序一致的结果列表。
+
+    默认串行；max_workers > 1 时用线程池并发查找（并发过高易触发 GitHub secondary
+    rate limit，失败会被记为无 PR）。on_result 在每个 Issue 查找完成时按完成顺序
+    回调 (已完成数, issue, pr)，用于实时输出进度。
+    """
+    lock = threading.Lock()
+    done = 0
+
+    def lookup(issue: dict) -> Optional[dict]:
+        nonlocal done
+        pr = find_pr_for_issue(issue["repo"], issue["number"])
+        if on_result is not None:
+            with lock:
+                done += 1
+                on_result(done, issue, pr)
+        return pr
+
+    if max_workers <= 1 or len(issues) <= 1:
+        return [lookup(issue) for issue in issues]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lookup, issues))
+
+
 def get_pr_state(pr: dict) -> str:
     """获取 PR 的状态: open/merged/closed。"""
     if pr.get("mergedAt"):
@@ -310,6 +345,12 @@ def main():
     )
     parser.add_argument("--owner", help="用户/组织 owner（默认从当前仓库推断）")
     parser.add_argument("--json", action="store_true", help="JSON 格式输出")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="并发查找 PR 的线程数（默认 1，即串行；过高易触发 GitHub 限流）",
+    )
     args = parser.parse_args()
 
     # 确定 owner
@@ -339,15 +380,17 @@ def main():
         "pr_closed": 0,
     }
 
-    for i, issue in enumerate(issues, 1):
-        if not args.json:
-            print(
-                f"[{i}/{len(issues)}] 查找 Issue #{issue['number']} 的 PR...",
-                file=sys.stderr,
-            )
+    def report_progress(done: int, issue: dict, pr: Optional[dict]) -> None:
+        found = f"PR #{pr['number']}" if pr else "无关联 PR"
+        print(f"[{done}/{len(issues)}] Issue #{issue['number']}: {found}", file=sys.stderr)
 
-        pr = find_pr_for_issue(issue["repo"], issue["number"])
+    prs = find_prs_for_issues(
+        issues,
+        max_workers=args.max_workers,
+        on_result=None if args.json else report_progress,
+    )
 
+    for issue, pr in zip(issues, prs):
         mapping = {
             "issue": issue["number"],
             "pr": None,
@@ -35,7 +35,7 @@ from get_project_prs import (
     get_repo_owner,
     list_project_items,
     filter_project_issues,
-    find_pr_for_issue,
+    find_prs_for_issues,
     get_pr_state,
 )
 from sort_by_priority import (
@@ -50,6 +50,7 @@ def run_phase_1_2(
     owner: str,
     project_number: int,
     verbose: bool = False,
+    max_workers: int = 1,
 ) -> tuple[list[dict], dict]:
     """
     Phase 1-2: 获取 Project Items 并查找关联 PR。
@@ -77,17 +78,17 @@ def run_phase_1_2(
         "pr_closed": 0,
     }
 
-    for i, issue in enumerate(issues, 1):
-        if verbose:
-            print(
-                f"  [{i}/{len(issues)}] Issue #{issue['number']}...",
-                file=sys.stderr,
-                end="",
-                flush=True,
-            )
+    def report_progress(done: int, issue: dict, pr: Optional[dict]) -> None:
+        found = f"PR #{pr['number']} ({get_pr_state(pr)})" if pr else "(no PR)"
+        print(f"  [{done}/{len(issues)}] Issue #{issue['number']} -> {found}", file=sys.stderr)
 
-        pr = find_pr_for_issue(issue["repo"], issue["number"])
+    prs = find_prs_for_issues(
+        issues,
+        max_workers=max_workers,
+        on_result=report_progress if verbose else None,
+    )
 
+    for issue, pr in zip(issues, prs):
         mapping = {
             "issue": issue["number"],
             "pr": None,
@@ -109,13 +110,8 @@ def run_phase_1_2(
                 stats["pr_merged"] += 1
             elif state == "closed":
                 stats["pr_closed"] += 1
-
-            if verbose:
-                print(f" -> PR #{pr['number']} ({state})", file=sys.stderr)
         else:
             stats["without_pr"] += 1
-            if verbose:
-                print(" -> (no PR)", file=sys.stderr)
 
         mappings.append(mapping)
 
@@ -248,6 +244,13 @@ Examples:
         action="store_true",
         help="JSON output format",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Concurrent PR lookups in Phase 2 (default: 1, serial; high values "
+        "risk GitHub secondary rate limits)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -268,6 +271,7 @@ Examples:
         owner=owner,
         project_number=args.project,
         verbose=args.verbose,
+        max_workers=args.max_workers,
     )
 
     # Phase 3: Sort and filter
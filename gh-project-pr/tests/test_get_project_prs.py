@@ -0,0 +1,67 @@
+import importlib.util
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+
+
+def _import_get_project_prs():
+    module_name = "scripts/get_project_prs"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    module_path = SCRIPTS_DIR / "get_project_prs.py"
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    assert spec and spec.loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+ISSUES = [{"repo": "o/r", "number": n} for n in (5, 1, 4, 2, 3)]
+
+
+def _install_fake_find_pr(monkeypatch: pytest.MonkeyPatch, get_project_prs) -> None:
+    """fake find_pr_for_issue：偶数 Issue 无 PR。"""
+
+    def fake_find(repo: str, issue_number: int):
+        if issue_number % 2 == 0:
+            return None
+        return {"number": 100 + issue_number, "title": f"PR for #{issue_number}"}
+
+    monkeypatch.setattr(get_project_prs, "find_pr_for_issue", fake_find)
+
+
+def test_find_prs_for_issues_pooled_matches_serial_in_issue_order(monkeypatch: pytest.MonkeyPatch):
+    get_project_prs = _import_get_project_prs()
+    _install_fake_find_pr(monkeypatch, get_project_prs)
+
+    serial = get_project_prs.find_prs_for_issues(ISSUES)
+    pooled = get_project_prs.find_prs_for_issues(ISSUES, max_workers=4)
+
+    assert pooled == serial
+    assert [pr["number"] if pr else None for pr in serial] == [105, 101, None, None, 103]
+
+
+def test_find_prs_for_issues_reports_each_result_as_it_finishes(monkeypatch: pytest.MonkeyPatch):
+    get_project_prs = _import_get_project_prs()
+    _install_fake_find_pr(monkeypatch, get_project_prs)
+    calls: list[tuple[int, int, bool]] = []
+    threads: set[str] = set()
+
+    def on_result(done, issue, pr):
+        threads.add(threading.current_thread().name)
+        calls.append((done, issue["number"], pr is not None))
+
+    get_project_prs.find_prs_for_issues(ISSUES, max_workers=5, on_result=on_result)
+
+    assert [c[0] for c in calls] == [1, 2, 3, 4, 5]
+    assert sorted(c[1] for c in calls) == [1, 2, 3, 4, 5]
+    # 回调在工作线程内触发（查找完成即输出），而非全部结束后在主线程补打
+    assert threading.main_thread().name not in threads
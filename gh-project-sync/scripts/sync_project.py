@@ -7,6 +7,7 @@
     python3 sync_project.py --project 1 --all
     python3 sync_project.py --project 1 --epic 72
     python3 sync_project.py --project 1 --issues "63" --json
+    python3 sync_project.py --project 1 --all --max-workers 4
 
 功能:
     1. 批量添加 Issues 到 Project
@@ -19,6 +20,7 @@ import json
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 
@@ -31,6 +33,14 @@ PRIORITY_STATUS_MAP: dict[str, str] = {
 }
 DEFAULT_STATUS = "Todo"
 
+# Sub-issue 引用模式（extract_sub_issues 使用）
+# Part of #N 或 Closes part of #N
+SUB_ISSUE_PART_OF_RE = re.compile(r"(?:Part of|Closes part of)\s*#(\d+)", re.IGNORECASE)
+# 任务列表中的引用 - [ ] #N
+SUB_ISSUE_TASK_RE = re.compile(r"-\s*\[[ x]\]\s*#(\d+)", re.IGNORECASE)
+# 直接引用 #N (在 Sub-issues 或 Tasks 标题下)
+SUB_ISSUE_SECTION_RE = re.compile(r"(?:Sub-issues|Tasks|子任务)[:\s]*(?:[\s\S]*?)#(\d+)", re.IGNORECASE)
+
 
 def get_repo_owner() -> Optional[str]:
     """从 git remote 获取仓库 owner。"""
@@ -168,20 +178,13 @@ def extract_sub_issues(body: str) -> list[int]:
     """
     sub_issues = set()
 
-    # Part of #N 或 Closes part of #N
-    pattern1 = r"(?:Part of|Closes part of)\s*#(\d+)"
-    for match in re.finditer(pattern1, body, re.IGNORECASE):
-        sub_issues.add(int(match.group(1)))
-
-    # 任务列表中的引用 - [ ] #N
-    pattern2 = r"-\s*\[[ x]\]\s*#(\d+)"
-    for match in re.finditer(pattern2, body, re.IGNORECASE):
-        sub_issues.add(int(match.group(1)))
+    # 三种模式都要求 "#N"，无 "#" 的 body 直接跳过三轮正则扫描
+    if not body or "#" not in body:
+        return []
 
-    # 直接引用 #N (在 Sub-issues 或 Tasks 标题下)
-    pattern3 = r"(?:Sub-issues|Tasks|子任务)[:\s]*(?:[\s\S]*?)#(\d+)"
-    for match in re.finditer(pattern3, body, re.IGNORECASE):
-        sub_issues.add(int(match.group(1)))
+    for pattern in (SUB_ISSUE_PART_OF_RE, SUB_ISSUE_TASK_RE, SUB_ISSUE_SECTION_RE):
+        for match in pattern.finditer(body):
+            sub_issues.add(int(match.group(1)))
 
     return sorted(sub_issues)
 
@@ -338,11 +341,62 @@ def set_item_status(project_id: str, item_id: str, field_id: str, option_id: str
     return bool(data.get("updateProjectV2ItemFieldValue"))
 
 
+def _sync_single_issue(
+    owner: str,
+    project_number: int,
+    repo_name: str,
+    issue_num: int,
+    project_id: str,
+    status_field: Optional[dict],
+    status_option_map: dict[str, str],
+) -> dict:
+    """同步单个 Issue 到 Project（添加 + 设置状态列），返回结果条目。"""
+    issue = get_issue_details(issue_num)
+    if not issue:
+        return {
+            "issue": issue_num,
+            "status": "error",
+            "message": "获取详情失败"
+        }
+
+    issue_url = issue.get("url") or f"https://github.com/{owner}/{repo_name}/issues/{issue_num}"
+    labels = issue.get("labels", [])
+    target_status = get_priority_from_labels(labels)
+
+    # 添加到 Project
+    item_id = add_issue_to_project(owner, project_number, issue_url)
+    if not item_id:
+        return {
+            "issue": issue_num,
+            "title": issue.get("title", ""),
+            "status": "error",
+            "message": "添加到 Project 失败"
+        }
+
+    # 设置状态列
+    status_set = False
+    if status_field and target_status in status_option_map:
+        status_set = set_item_status(
+            project_id,
+            item_id,
+            status_field["id"],
+            status_option_map[target_status]
+        )
+
+    return {
+        "issue": issue_num,
+        "title": issue.get("title", ""),
+        "status_column": target_status,
+        "status": "success" if status_set else "partial",
+    }
+
+
 def sync_issues_to_project(
     owner: str,
     project_number: int,
     issue_numbers: list[int],
-    json_output: bool = False
+    json_output: bool = False,
+    max_workers: int = 1,
 ) -> dict:
     """
     同步 Issues 到 Project。
@@ -371,54 +425,25 @@ def sync_issues_to_project(
         print("Error: 无法获取仓库名称", file=sys.stderr)
         sys.exit(1)
 
-    results = []
-    status_counts = {"In Progress": 0, "Todo": 0, "Backlog": 0, "Review": 0, "Done": 0}
-
-    for issue_num in issue_numbers:
-        issue = get_issue_details(issue_num)
-        if not issue:
-            results.append({
-                "issue": issue_num,
-                "status": "error",
-                "message": "获取详情失败"
-            })
-            continue
+    def sync_one(issue_num: int) -> dict:
+        return _sync_single_issue(
+            owner, project_number, repo_name, issue_num,
+            project_id, status_field, status_option_map,
+        )
 
-        issue_url = issue.get("url") or f"https://github.com/{owner}/{repo_name}/issues/{issue_num}"
-        labels = issue.get("labels", [])
-        target_status = get_priority_from_labels(labels)
-
-        # 添加到 Project
-        item_id = add_issue_to_project(owner, project_number, issue_url)
-        if not item_id:
-            results.append({
-                "issue": issue_num,
-                "title": issue.get("title", ""),
-                "status": "error",
-                "message": "添加到 Project 失败"
-            })
-            continue
+    # 每个 Issue 需串行调用 3 次 gh，Issue 之间互不依赖，可并发执行（map 保持输出顺序）
+    if max_workers <= 1 or len(issue_numbers) <= 1:
+        results = [sync_one(n) for n in issue_numbers]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(sync_one, issue_numbers))
 
-        # 设置状态列
-        status_set = False
-        if status_field and target_status in status_option_map:
-            status_set = set_item_status(
-                project_id,
-                item_id,
-                status_field["id"],
-                status_option_map[target_status]
-            )
-
-        if status_set:
+    status_counts = {"In Progress": 0, "Todo": 0, "Backlog": 0, "Review": 0, "Done": 0}
+    for r in results:
+        if r["status"] == "success":
+            target_status = r["status_column"]
             status_counts[target_status] = status_counts.get(target_status, 0) + 1
 
-        results.append({
-            "issue": issue_num,
-            "title": issue.get("title", ""),
-            "status_column": target_status,
-            "status": "success" if status_set else "partial",
-        })
-
     output = {
         "project": {
             "number": project_number,
@@ -474,6 +499,15 @@ def main():
     parser.add_argument("--epic", "-e", type=int, help="Epic Issue 编号，自动包含 Sub-issues")
     parser.add_argument("--owner", help="仓库/组织 owner")
     parser.add_argument("--json", action="store_true", help="JSON 格式输出")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help=(
+            "并发同步的 Issue 数（默认 1，即串行）。> 1 时会并发发出 GraphQL mutation，"
+            "GitHub 建议 mutation 串行调用，并发过高易触发 secondary rate limit"
+        ),
+    )
     args = parser.parse_args()
 
     owner = args.owner or get_repo_owner()
@@ -531,6 +565,7 @@ def main():
         project_number=args.project,
         issue_numbers=issue_numbers,
         json_output=args.json,
+        max_workers=args.max_workers,
     )
 
     print_results(output, args.json)
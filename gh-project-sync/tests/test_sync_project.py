@@ -0,0 +1,87 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = REPO_ROOT / "scripts"
+
+
+def _import_sync_project():
+    module_name = "scripts/sync_project"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    module_path = SCRIPTS_DIR / "sync_project.py"
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    assert spec and spec.loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+PROJECT_INFO = {
+    "id": "PVT_1",
+    "title": "Sprint",
+    "url": "https://github.com/o/r/projects/1",
+    "status_field": {
+        "id": "F_1",
+        "options": [
+            {"name": "In Progress", "id": "opt-ip"},
+            {"name": "Todo", "id": "opt-todo"},
+            {"name": "Backlog", "id": "opt-bl"},
+        ],
+    },
+}
+
+ISSUES = {
+    1: {"title": "a", "labels": [{"name": "priority:p0"}]},
+    # 2: 获取详情失败
+    3: {"title": "c", "labels": []},
+    4: {"title": "d", "labels": [{"name": "priority:p3"}]},  # 添加到 Project 失败
+    5: {"title": "e", "labels": [{"name": "priority:p1"}]},  # 设置状态失败 -> partial
+    6: {"title": "f", "labels": [{"name": "priority:p3"}]},
+}
+
+
+def _install_fake_gh(monkeypatch: pytest.MonkeyPatch, sync_project) -> None:
+    def fake_details(issue_number: int):
+        issue = ISSUES.get(issue_number)
+        if issue is None:
+            return None
+        return {**issue, "url": f"https://github.com/o/r/issues/{issue_number}"}
+
+    def fake_add(owner: str, project_number: int, issue_url: str):
+        number = int(issue_url.rsplit("/", 1)[-1])
+        return None if number == 4 else f"ITEM_{number}"
+
+    def fake_set_status(project_id: str, item_id: str, field_id: str, option_id: str) -> bool:
+        return item_id != "ITEM_5"
+
+    monkeypatch.setattr(sync_project, "get_project_info", lambda owner, number: PROJECT_INFO)
+    monkeypatch.setattr(sync_project, "get_repo_name", lambda: "r")
+    monkeypatch.setattr(sync_project, "get_issue_details", fake_details)
+    monkeypatch.setattr(sync_project, "add_issue_to_project", fake_add)
+    monkeypatch.setattr(sync_project, "set_item_status", fake_set_status)
+
+
+def test_sync_issues_to_project_pooled_matches_serial(monkeypatch: pytest.MonkeyPatch):
+    sync_project = _import_sync_project()
+    _install_fake_gh(monkeypatch, sync_project)
+    numbers = [6, 5, 4, 3, 2, 1]
+
+    serial = sync_project.sync_issues_to_project("o", 1, numbers, max_workers=1)
+    pooled = sync_project.sync_issues_to_project("o", 1, numbers, max_workers=4)
+
+    assert pooled == serial
+    assert [r["issue"] for r in serial["results"]] == numbers
+    assert [r["status"] for r in serial["results"]] == [
+        "success", "partial", "error", "success", "error", "success",
+    ]
+    assert serial["synced"] == 4
+    assert serial["failed"] == 2
+    # partial 不计入状态列统计
+    assert serial["status_counts"] == {"In Progress": 1, "Todo": 1, "Backlog": 1}